@@ -1,4 +1,5 @@
 
+import sys
 import typing as t
 from types import SimpleNamespace
 
@@ -23,11 +24,15 @@ from .exception import CommandUsageException, CommandArgException
 class Command(object):
     """Represents a super-class for all command-like objects"""
     
+    _name: str = "command"
+
     line_number: int
     script: 'Script'
 
     def __init_subclass__(cls) -> None:
-        pass
+        # The command keyword never changes for a given class, intern it once
+        # here instead of lowercasing the class name on every name access
+        cls._name = sys.intern(cls.__name__.lower())
     
     def construct(self) -> str:
         """Builds the command at runtime to allow for relative paths to be decided before reference
@@ -52,7 +57,7 @@ class Command(object):
     
     @property
     def name(self) -> str:
-        return self.__class__.__name__.lower()
+        return self._name
 
 
 class Advancement(Command):
@@ -1,8 +1,7 @@
 import os
 import typing as t
 
-import contextlib
-import shutil
+import functools
 import json
 
 from .exception import DatapackException 
@@ -10,8 +9,8 @@ from .shared import DirectoryFlags, PackFile
 
 from .scripts import Module, Script
 from .command import Command
+from .versions import Version
 
-from . import constants as const
 class Datapack:
     """Represents a de-compiled datapack"""
     
@@ -22,6 +21,11 @@ class Datapack:
     
     _target_path: os.PathLike
     _target_version: str
+
+    _full_path: os.PathLike
+    _data_path: os.PathLike
+    _full_functions_path: os.PathLike
+    _minecraft_path: os.PathLike
     
     _dir_flags: DirectoryFlags
     
@@ -30,6 +34,11 @@ class Datapack:
     _tick_scripts: list[Script]
     _load_scripts: list[Script]
 
+    _built_paths: set[os.PathLike]
+
+    _generated_header: str
+    _script_header: str
+
     author: str
         
     # --< Overrides >-- #
@@ -49,7 +58,14 @@ class Datapack:
         
         self._target_path = build_path
         self._target_version = version # This should be moved to a type class with exceptions
-        
+
+        # These never change after naming the pack, so join them once instead
+        # of per property access
+        self._full_path = os.path.join(build_path, pack_name)
+        self._data_path = os.path.join("data", namespace)
+        self._full_functions_path = os.path.join(self._full_path, self._data_path, "functions")
+        self._minecraft_path = os.path.join(self._full_path, "data", "minecraft")
+
         self._dir_flags = DirectoryFlags(
             {
                 "functions" : [
@@ -66,7 +82,13 @@ class Datapack:
         self._scripts = []
         self._tick_scripts = []
         self._load_scripts =[]
-        
+
+        self._built_paths = set()
+
+        # Every generated file carries the same header, render both forms once
+        self._generated_header = f"# This file was automatically generated for {pack_name}\n"
+        self._script_header = f"# This file was automatically generated for {pack_name} using DPCompile #\n# <=-=-=-=-=-=>"
+
         self.author = author
     
     
@@ -77,24 +99,26 @@ class Datapack:
         
         if not os.path.exists(self.build_target):
             raise DatapackException("Build path does not exist")
-        
-        # remove full datapack to allow for re-building
-        with contextlib.suppress(FileNotFoundError):
-            shutil.rmtree(self.full_path)
-        
-        os.mkdir(self.full_path)
-        
+
+        # Files are written over the previous build in place, tracking every
+        # path touched so leftovers can be swept afterwards, instead of
+        # deleting and re-creating the entire tree
+        self._built_paths = set()
+
+        os.makedirs(self.full_path, exist_ok = True)
+
         # Create required directories
         self._dir_flags.create_directories()
-        
-        with open(os.path.join(self._target_path, self._pack_name, "pack.mcmeta"), "x") as f:
+
+        with open(os.path.join(self._target_path, self._pack_name, "pack.mcmeta"), "w") as f:
             json.dump({
                 "pack": {
-                    "pack_format": const._PACK_VERSION_REFERENCE[self.version],
+                    "pack_format": Version.parse(self.version).pack_format,
                     "description": self._description
                 }
             }, f, indent = 4)
-        
+        self._built_paths.add(os.path.join(self._target_path, self._pack_name, "pack.mcmeta"))
+
         for module in self._script_modules:
             module.build()
         
@@ -102,42 +126,53 @@ class Datapack:
             script.build()
         
         # Create the tick and load files
-        
-        # THIS SHOUD BE A FUNCTION BECAUSE IT'S RUN TWICE
         if self._dir_flags.get_flag("functions"):
-            with open(os.path.join(self.minecraft_path, "tags", "functions", "tick.json"), "x") as f:
-                
-                paths = []
-                for script in self._tick_scripts:
-                    script.build()
-                    paths.append(script.relative_path)
-                
-                json.dump({
-                    "values" : paths
-                }, f, indent = 4)
-            
-            with open(os.path.join(self.minecraft_path, "tags", "functions", "load.json"), "x") as f:
-                
-                paths = []
-                for script in self._load_scripts:
-                    script.build()
-                    paths.append(script.relative_path)
-                
-                json.dump({
-                    "values" : paths
-                }, f, indent = 4)
+            self._build_function_tag("tick", self._tick_scripts)
+            self._build_function_tag("load", self._load_scripts)
         
         # Creates a file for credis and other pack information
-        PackFile("Credits.md", lambda : [
+        credits = PackFile("Credits.md", lambda : [
             "This file was created using DPCompile",
             "----------------------",
             f"Pack Name: {self._pack_name}",
             f"Author: {self.author}",
             "This pack has no registered extensions"
-        ], path = "", root = self.full_path).build()
-        
-        
-    
+        ], path = "", root = self.full_path)
+        credits.build()
+        self._built_paths.add(credits.path)
+
+        # Drop anything left over from a previous build that this build
+        # did not write
+        for root, _, files in os.walk(self.full_path):
+            for filename in files:
+                file_path = os.path.join(root, filename)
+                if file_path not in self._built_paths:
+                    os.remove(file_path)
+
+
+    def _build_function_tag(self, name: str, scripts: list[Script]) -> None:
+        """Builds a group of scripts and the minecraft function tag that
+        references them, skipping the tag file when the group is empty
+
+        Args:
+            name (str): The name of the tag file, ex: "tick"
+            scripts (list[Script]): The scripts registered under that tag
+        """
+        if not scripts:
+            return
+
+        paths = []
+        for script in scripts:
+            script.build()
+            paths.append(script.relative_path)
+
+        tag_path = os.path.join(self.minecraft_path, "tags", "functions", f"{name}.json")
+        with open(tag_path, "w") as f:
+            json.dump({
+                "values" : paths
+            }, f, indent = 4)
+        self._built_paths.add(tag_path)
+
     def add_module(self, module: Module) -> None:
         """Adds a module to the datapack for compilation
 
@@ -149,6 +184,8 @@ class Datapack:
         module._root = self.full_functions_path
         module._path = ""
         module._pack = self
+        module._cached_path = None
+        module._cached_relpath = None
     
     def add_script(self, script: Script) -> None:
         """Adds a PackFile to this instance
@@ -161,7 +198,31 @@ class Datapack:
         script._root = self.full_functions_path # update file's path
         script._path = ""
         script._pack = self
+        script._cached_path = None
+        script._cached_relpath = None
     
+    def _make_script(self, name: str, f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
+        """Registers a Script built from a content function, shared by every
+        script() decorator instead of a closure per call"""
+        self.add_script(Script(
+            name = name,
+            content = f
+        ))
+        return f
+
+    def _make_tagged_script(self, registry: list[Script], name: str, f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
+        """Registers a Script into a function-tag group (tick/load)"""
+        script = Script(
+            name = name,
+            content = f
+        )
+        self._dir_flags.set_flag("functions")
+        registry.append(script)
+        script._root = self.full_functions_path
+        script._path = ""
+        script._pack = self
+        return f
+
     def script(self, name: str) -> t.Callable:
         """Adds script from a function that returns a str or a list[str]
 
@@ -171,44 +232,13 @@ class Datapack:
         Returns:
             t.Callable: The function that returns content
         """
-        def wrapper(f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
-            script = Script(
-                name = name,
-                content = f
-            )
-            self.add_script(script)
-            return f
-        return wrapper
-    
+        return functools.partial(self._make_script, name)
+
     def tick(self, name: str) -> t.Callable:
-        def wrapper(f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
-            script = Script(
-                name = name,
-                content = f
-            )
-            self._dir_flags.set_flag("functions")
-            self._tick_scripts.append(script)
-            script._root = self.full_functions_path
-            script._path = ""
-            script._pack = self
-            
-            return f
-        return wrapper
-    
+        return functools.partial(self._make_tagged_script, self._tick_scripts, name)
+
     def load(self, name: str) -> t.Callable:
-        def wrapper(f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
-            script = Script(
-                name = name,
-                content = f
-            )
-            self._dir_flags.set_flag("functions")
-            self._load_scripts.append(script)
-            script._root = self.full_functions_path
-            script._path = ""
-            script._pack = self
-            
-            return f
-        return wrapper
+        return functools.partial(self._make_tagged_script, self._load_scripts, name)
     
     
     
@@ -231,18 +261,18 @@ class Datapack:
     @property
     def full_path(self) -> os.PathLike:
         """Returns the full path to the root of the datapack, including the pack name"""
-        return os.path.join(self.build_target, self._pack_name)
-    
+        return self._full_path
+
     @property
     def data_path(self) -> os.PathLike:
         """Returns the relative path to the data folder"""
-        return os.path.join("data", self.namespace)
-    
+        return self._data_path
+
     @property
     def full_functions_path(self) -> os.PathLike:
         """Returns the path to the data/<namespace>/functions folder from build target"""
-        return os.path.join(self.full_path, self.data_path, "functions")
-    
+        return self._full_functions_path
+
     @property
     def minecraft_path(self) -> os.PathLike:
-        return os.path.join(self.full_path, "data", "minecraft")
\ No newline at end of file
+        return self._minecraft_path
\ No newline at end of file
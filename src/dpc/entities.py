@@ -1,3 +1,4 @@
+import sys
 import typing as t
 from .types import Selector
 
@@ -9,11 +10,15 @@ class EntityData(t.TypedDict):
         super(EntityData, self).__init__()
 
 class Entity(object):
-    
+
+    __slots__ = ("data", "_value", "_nbt", "_nbt_str", "_cmd_str")
+
     _data: EntityData
     _value: str
     _nbt: dict|None
-    
+    _nbt_str: str
+    _cmd_str: str
+
     def __init__(self, value: str, data: dict | None = None) -> None:
         """NEEDS REFACTOR
 
@@ -21,8 +26,10 @@ class Entity(object):
             value (str): The value for this entity
         """
         self.data = EntityData()
-        self._value = value
+        self._value = sys.intern(value)
         self._nbt = data
+        self._nbt_str = f"[{data}]" if data else ""
+        self._cmd_str = self._value + self._nbt_str
     
     @t.overload
     def selector(cls, selector: Selector) -> 'Entity':
@@ -46,12 +53,15 @@ class Entity(object):
         instance = cls(selector, data)
         return instance
     
+    def __str__(self) -> str:
+        return self._cmd_str
+
     def nbt(self, data: dict[str, t.Any]) -> t.Self:
         self._nbt = data
+        self._nbt_str = f"[{data}]" if data else ""
+        self._cmd_str = self._value + self._nbt_str
         return self
-    
+
     @property
     def cmd_str(self) -> str:
-        if not self._nbt:
-            return f"{self._value}"
-        return f"{self._value}[{self._nbt}]"
\ No newline at end of file
+        return self._cmd_str
\ No newline at end of file
@@ -1,13 +1,15 @@
-import os
+import functools
 import typing as t
 
 from .shared import PackFile, PackDirectory
 from .command import Command
 
 class Script(PackFile):
-    
+
+    __slots__ = ()
+
     _DEFAULT_SUFFIX = "mcfunction"
-    
+
     _content: str | Command | list[str, Command]
     
     def __init__(self, name: str, content: t.Callable[..., str | Command | list[str, Command]], *args, **kwargs) -> None:
@@ -20,27 +22,37 @@ class Script(PackFile):
         super(Script, self).__init__(name, content, *args, **kwargs)
     
     def build(self) -> None:
-        aspect = "x" if not os.path.exists(self.path) else "a"
-        
+        # Append only when this build already created the file; a file left
+        # over from a previous build gets overwritten instead
+        already_built = self.path in self._pack._built_paths
+        aspect = "ab" if already_built else "wb"
+
         with open(self.path, aspect) as f:
             content = self._content()
-            if not isinstance(content, list):
-                content = content.split("\n")
-            
-            for index, line in enumerate(content):
-                if isinstance(line, Command):
-                    line.update_data(index, self)
-                    content[index] = line.construct()
-            
-            content = "\n".join(content)
-            
-            message = f"# This file was automatically generated for {self._pack._pack_name} using DPCompile #\n# <=-=-=-=-=-=>" if aspect == "x" else ""
-            
-            f.write(f"{message}\n{content}")
+            # Plain string content cannot contain commands, skip the
+            # split/join round-trip entirely
+            if not isinstance(content, str):
+                parts = []
+                for index, line in enumerate(content):
+                    if isinstance(line, Command):
+                        line.update_data(index, self)
+                        line = line.construct()
+                    parts.append(line)
+                content = "\n".join(parts)
+
+
+            message = "" if already_built else self._pack._script_header
+
+            # One encode of the finished buffer, written through the raw
+            # stream with no TextIOWrapper in between
+            f.write(f"{message}\n{content}".encode("utf-8"))
+
+        self._pack._built_paths.add(self.path)
 
 class Module(PackDirectory):
-    
-    
+
+    __slots__ = ()
+
     def __init__(self, name: str, pack: object) -> None:
         super().__init__(name)
         pack.add_module(self)
@@ -49,6 +61,15 @@ class Module(PackDirectory):
         else:
             self._root = pack.full_functions_path
     
+    def _make_script(self, name: str, f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
+        """Registers a Script built from a content function, shared by every
+        script() decorator instead of a closure per call"""
+        self.add_file(Script(
+            name = name,
+            content = f
+        ))
+        return f
+
     def script(self, name: str) -> t.Callable:
         """Adds script from a function that returns a str or a list[str]
 
@@ -58,16 +79,7 @@ class Module(PackDirectory):
         Returns:
             t.Callable: The function that returns content
         """
-        
-        def wrapper(f: t.Callable[..., str | Command | list[str, Command]]) -> t.Callable:
-            script = Script(
-                name = name,
-                content = f
-            )
-            self.add_file(script)
-            return f
-    
-        return wrapper
+        return functools.partial(self._make_script, name)
     
     def add_module(self, module) -> None:
         self.add_dir(module)
\ No newline at end of file
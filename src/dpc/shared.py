@@ -1,15 +1,16 @@
 import os
 import typing as t
 
-from pathlib import Path
-
 
 class DirectoryFlags(object):
     """Creates required directories conditionally based on modules added"""
-    
-    _flags: dict[str, os.PathLike]
+
+    __slots__ = ("_paths", "_set", "_root_path")
+
+    _paths: dict[str, os.PathLike | list[os.PathLike]]
+    _set: set[str]
     _root_path: os.PathLike
-    
+
     def __init__(self, flags: dict[str, os.PathLike | list[os.PathLike]], root_path: os.PathLike) -> None:
         """Creates a set of paths based on conditional flags for each path
 
@@ -18,14 +19,10 @@ class DirectoryFlags(object):
             root_path (os.PathLike): The target build path
         """
         self._root_path = root_path
-        
-        self._flags = {}
-        for key, value in flags.items():
-            self._flags[key] = {
-                "path" : value,
-                "set" : False
-            }
-    
+
+        self._paths = dict(flags)
+        self._set = set()
+
     def set_flag(self, flag: str, *, value: bool = True) -> None:
         """Sets a directories flag
 
@@ -33,46 +30,62 @@ class DirectoryFlags(object):
             flag (str): The key to the directory
             value (bool, optional): Value to set flag to. Defaults to True.
         """
-        self._flags[flag]["set"] = value
-    
+        if flag not in self._paths:
+            raise KeyError(flag)
+        if value:
+            self._set.add(flag)
+        else:
+            self._set.discard(flag)
+
     def get_flag(self, flag: str) -> bool:
-        return self._flags[flag]["set"]
+        return flag in self._set
+
 
-    
     def create_directories(self) -> None:
         """Creates paths that have their flag set to True"""
-        for path in self._flags.values():
-            if path["set"]:
-                if isinstance(path["path"], list):
-                    [Path.mkdir(Path(os.path.join(self._root_path, pth)), parents=True, exist_ok=True) for pth in path["path"]]
-                else:
-                    Path.mkdir(os.path.join(self._root_path, path["path"]), parents=True, exist_ok=True)
+        for flag in self._set:
+            path = self._paths[flag]
+            if isinstance(path, list):
+                for pth in path:
+                    os.makedirs(os.path.join(self._root_path, pth), exist_ok=True)
+            else:
+                os.makedirs(os.path.join(self._root_path, path), exist_ok=True)
 
 
 class PackDirectory(object):
     """Represents a directory within the datapack folder"""
-    
+
+    __slots__ = ("_path", "_root", "_name", "_directories", "_files", "_pack", "_cached_path", "_cached_relpath")
+
     _path: os.PathLike | None
     _root: os.PathLike | None
     _name: str
     
     _directories: list['PackDirectory']
     _files: list['PackFile']
-    
+
     _pack: object
-    
+
+    _cached_path: os.PathLike | None
+    _cached_relpath: os.PathLike | None
+
     def __init__(self, name: str, *, path: os.PathLike | None = None) -> None:
         self._name = name
         self._path = path
         self._root = None
-        
+        self._pack = None
+
         self._directories = []
         self._files = []
+
+        self._cached_path = None
+        self._cached_relpath = None
     
     def build(self) -> None:
-        """Builds this directory and all sub-dirs"""
-        os.mkdir(self.path) # Replace with a recursive solution to allow for modules to contain more than one dir
-        # ex: test/(test2) - Module name
+        """Builds this directory, its files, and all sub-dirs recursively"""
+        os.makedirs(self.path, exist_ok = True)
+        for dir in self._directories:
+            dir.build()
         for file in self._files:
             file.build()
     
@@ -84,8 +97,10 @@ class PackDirectory(object):
         """
         self._directories.append(dir) # consider changing to a WeakRef to the directory
         dir._root = self._root
-        dir._path = self.relative_path # update path
+        dir._path = os.path.join(self._path, self._name) # update path
         dir._pack = self._pack
+        dir._cached_path = None
+        dir._cached_relpath = None
     
     def add_file(self, file: 'PackFile') -> None:
         """Adds a PackFile to this instance
@@ -97,6 +112,8 @@ class PackDirectory(object):
         file._root = self._root
         file._path = os.path.join(self._path, self._name) # update file's path
         file._pack = self._pack
+        file._cached_path = None
+        file._cached_relpath = None
     
     @property
     def name(self) -> str:
@@ -106,18 +123,24 @@ class PackDirectory(object):
     @property
     def path(self) -> os.PathLike:
         """The path to this directory relative to root"""
-        return os.path.join(self._root, self._path, self.name)
-    
+        if self._cached_path is None:
+            self._cached_path = os.path.join(self._root, self._path, self.name)
+        return self._cached_path
+
     @property
     def relative_path(self) -> os.PathLike:
         """Return the path to this file relative to the datapack"""
-        return f"{self._pack.namespace}:{os.path.join(self._path, self.name)}"
+        if self._cached_relpath is None:
+            self._cached_relpath = f"{self._pack.namespace}:{os.path.join(self._path, self.name)}"
+        return self._cached_relpath
     
 
 class PackFile(object):
-    
+
+    __slots__ = ("_path", "_root", "_name", "_suffix", "_content", "_pack", "_cached_path", "_cached_relpath")
+
     _DEFAULT_SUFFIX: str = "txt"
-    
+
     _path: os.PathLike | None
     _root: os.PathLike | None
     _name: str
@@ -125,7 +148,10 @@ class PackFile(object):
     
     _content: t.Callable
     _pack: object # Datapack
-    
+
+    _cached_path: os.PathLike | None
+    _cached_relpath: os.PathLike | None
+
     def __init__(self, name: str, content: str | t.Callable[..., str | list[str]], *, path: os.PathLike | None = None, root: os.PathLike | None = None) -> None:
         """Represents a file within this pack
 
@@ -143,16 +169,24 @@ class PackFile(object):
         self._path = root
         self._root = root
         self._content = content
+        self._pack = None
+
+        self._cached_path = None
+        self._cached_relpath = None
     
     def build(self) -> None:
-        """Creates this file in the targeted directory and populates with content"""
-        with open(self.path, "x") as f:
+        """Creates this file in the targeted directory and populates with content,
+        overwriting whatever a previous build left behind"""
+        with open(self.path, "w") as f:
             content = self._content()
             if isinstance(content, list):
                 content = "\n".join(content)
-            try:
-                f.write(f"# This file was automatically generated for {self._pack._pack_name}\n{content}")
-            except AttributeError:
+            # _pack defaults to None until the file is wired into a pack, so
+            # a plain check replaces probing for the attribute
+            if self._pack is not None:
+                f.write(self._pack._generated_header + content)
+                self._pack._built_paths.add(self.path)
+            else:
                 f.write(f"{content}")
     
     @property
@@ -163,8 +197,12 @@ class PackFile(object):
     @property
     def path(self) -> os.PathLike:
         """The path to this file relative to the root path"""
-        return os.path.join(self._root, self._path, self.name)
-    
+        if self._cached_path is None:
+            self._cached_path = os.path.join(self._root, self._path, self.name)
+        return self._cached_path
+
     @property
     def relative_path(self) -> os.PathLike:
-        return f"{self._pack.namespace}:{os.path.join(self._path, self._name)}"
\ No newline at end of file
+        if self._cached_relpath is None:
+            self._cached_relpath = f"{self._pack.namespace}:{os.path.join(self._path, self._name)}"
+        return self._cached_relpath
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 import typing as t
 import os
 
@@ -15,12 +16,24 @@ BlockTarget = t.Union[
 class WorldPosition:
     ...
 
+# Prefix characters for each coordinate reference frame
+_RELATIVE_PREFIX = {
+    "world" : '',
+    "entity" : '~',
+    "rotation" : '^'
+}
+
 
 class BlockPosition:
-    
-    _position: tuple[int, int, int]
+
+    __slots__ = ("_x", "_y", "_z", "_relative", "_cmd_cache")
+
+    _x: int
+    _y: int
+    _z: int
     _relative: t.Literal["world", "entity", "rotation"]
-    
+    _cmd_cache: str | None
+
     def __init__(self, x: int, y: int, z: int, relative: t.Literal["world", "entity", "rotation"] = "world") -> None:
         """Represents a position of a block in the world, can be relative to
         the world, an entity ('~') or an entity rotation ('^')
@@ -31,41 +44,53 @@ class BlockPosition:
             z (int): Block Z position
             relative (["world", "entity", "rotation"], optional): What this position is relative to. Defaults to "world".
         """
-        self._position = (x, y, z)
+        self._x = x
+        self._y = y
+        self._z = z
         self._relative = relative
-        
+        self._cmd_cache = None
+
     def __str__(self) -> str:
-        return f"<BlockPosition ({self.x}, {self.y}, {self.z})>"
-    
+        return f"<BlockPosition ({self._x}, {self._y}, {self._z})>"
+
     def __add__(self, value: 'BlockPosition') -> None:
-        self._position = (self.x + value.x, self.y + value.y, self.z + value.z)
-    
+        self._x += value._x
+        self._y += value._y
+        self._z += value._z
+        self._cmd_cache = None
+
     def __sub__(self, value: 'BlockPosition') -> None:
-        self._position = (self.x - value.x, self.y - value.y, self.z - value.z)
-        
+        self._x -= value._x
+        self._y -= value._y
+        self._z -= value._z
+        self._cmd_cache = None
+
     @property
     def x(self) -> int:
-        return self._position[0]
-    
+        return self._x
+
     @x.setter
     def x(self, value: int) -> None:
-        self._position = (self.x + value, self.y, self.z)
-    
+        self._x = value
+        self._cmd_cache = None
+
     @property
     def y(self) -> int:
-        return self._position[1]
-    
+        return self._y
+
     @y.setter
     def y(self, value: int) -> None:
-        self._position = (self.x, self.y + value, self.z)
-    
+        self._y = value
+        self._cmd_cache = None
+
     @property
     def z(self) -> int:
-        return self._position[2]
-    
+        return self._z
+
     @z.setter
     def z(self, value: int) -> None:
-        self._position = (self.x, self.y, self.z + value)
+        self._z = value
+        self._cmd_cache = None
     
     @property
     def is_absolute(self) -> bool:
@@ -74,15 +99,15 @@ class BlockPosition:
     
     @property
     def cmd_str(self) -> str:
-        relative = {
-            "world" : '',
-            "entity" : '~',
-            "rotation" : '^'
-        }[self._relative]
-        return f"{relative}{self.x} {relative}{self.y} {relative}{self.z}"
+        if self._cmd_cache is None:
+            relative = _RELATIVE_PREFIX[self._relative]
+            self._cmd_cache = f"{relative}{self._x} {relative}{self._y} {relative}{self._z}"
+        return self._cmd_cache
 
 class UUID:
-    
+
+    __slots__ = ("_value",)
+
     _value: str
     
     def __init__(self, value: str | int) -> None:
@@ -92,31 +117,43 @@ class UUID:
         return self._value
 
 class Swizzle:
-    
+
+    __slots__ = ("x", "y", "z", "_value")
+
     x: bool
     y: bool
     z: bool
-    
+    _value: str
+
     def __init__(self, dir: list[t.Literal["x","y","z"]]) -> None:
         self.x = "x" in dir
         self.y = "y" in dir
         self.z = "z" in dir
-    
+        self._value = sys.intern("".join(axis for axis in "xyz" if axis in dir))
+
     def __call__(self) -> str:
         return self.value()
-    
+
     def value(self) -> str:
-        return f"{'x' if self.x else ''}{'y' if self.y else ''}{'z' if self.z else ''}"
+        return self._value
 
 class Biome:
-    
+
+    __slots__ = ("name", "namespace", "_str")
+
     name: str
     namespace: str
-    
+    _str: str
+
     def __init__(self, name: str) -> None:
-        name = name.split(":")
-        self.name = name[0] if len(name) == 1 else name[2]
-        self.namespace = name[0] if len(name) == 2 else "minecraft"
-    
+        namespace, sep, name = name.partition(":")
+        if sep:
+            self.name = sys.intern(name)
+            self.namespace = sys.intern(namespace)
+        else:
+            self.name = sys.intern(namespace)
+            self.namespace = "minecraft"
+        self._str = f"{self.namespace}:{self.name}"
+
     def __str__(self) -> str:
-        return f"{self.namespace}:{self.name}"
\ No newline at end of file
+        return self._str
\ No newline at end of file
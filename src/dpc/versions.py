@@ -2,8 +2,10 @@
 
 class Version(object):
     """Represents a version of the game"""
-    
-    _PACK_VERSION_REFERENCE = { # Move to types.py in the verson section 
+
+    __slots__ = ("data",)
+
+    _PACK_VERSION_REFERENCE = { # Move to types.py in the verson section
         "1.13"   : 4,
         "1.14.1" : 4,
         "1.15.1" : 5,
@@ -31,8 +33,195 @@ class Version(object):
         "1.21"   : 48,
         "1.21.1" : 48,
     }
-    
-    _version: str
-    
-    def __init__(self, version: str) -> None:
-        ...
\ No newline at end of file
+
+    data: tuple[int, int, int]
+
+    def __init__(self, *version: str | int) -> None:
+        """Parses a version from a string like '1.20.1' or from three
+        integer components
+
+        Args:
+            *version (str | int): A single version string with one to three
+                dot-separated parts, or three integers (major, minor, patch)
+        """
+        if len(version) == 1:
+            parts = version[0].split(".", 2)
+            self.data = (
+                int(parts[0]),
+                int(parts[1]) if len(parts) > 1 else 0,
+                int(parts[2]) if len(parts) > 2 else 0
+            )
+        elif len(version) == 3:
+            major, minor, patch = version
+            self.data = (int(major), int(minor), int(patch))
+        else:
+            raise ValueError("Version() takes a single version string or three integers")
+
+    @classmethod
+    def parse(cls, version: str) -> 'Version':
+        """Returns a cached Version for the given string, parsing at most once
+
+        Version instances are immutable, so every caller asking for the same
+        string shares one instance
+
+        Args:
+            version (str): The version string, with one to three dot-separated parts
+
+        Returns:
+            Version: The cached instance for that string
+        """
+        instance = _PARSE_CACHE.get(version)
+        if instance is None:
+            instance = cls(version)
+            _PARSE_CACHE[version] = instance
+        return instance
+
+    def __str__(self) -> str:
+        return f"{self.data[0]}.{self.data[1]}.{self.data[2]}"
+
+    # Comparisons delegate to the data tuple so ordering is a single
+    # C-level lexicographic compare
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Version) and self.data == other.data
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __lt__(self, other: 'Version') -> bool:
+        return self.data < other.data
+
+    def __le__(self, other: 'Version') -> bool:
+        return self.data <= other.data
+
+    def __gt__(self, other: 'Version') -> bool:
+        return self.data > other.data
+
+    def __ge__(self, other: 'Version') -> bool:
+        return self.data >= other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    @classmethod
+    def _raw(cls, data: tuple[int, int, int]) -> 'Version':
+        """Wraps an already-parsed data tuple with no validation, for
+        internal callers that are known to hold three ints
+
+        Args:
+            data (tuple[int, int, int]): The (major, minor, patch) tuple
+        """
+        instance = object.__new__(cls)
+        instance.data = data
+        return instance
+
+    @classmethod
+    def minimum(cls) -> 'Version':
+        """The lowest version the library supports, shared as a singleton"""
+        return _MIN_VERSION
+
+    @classmethod
+    def maximum(cls) -> 'Version':
+        """The highest version the library supports, shared as a singleton"""
+        return _MAX_VERSION
+
+    @property
+    def pack_format(self) -> int:
+        """The pack_format number this version of the game expects"""
+        return self._PACK_VERSION_REFERENCE_TUPLE[self.data]
+
+
+# Same table keyed by the parsed data tuple, built once at import, so
+# lookups from a Version never re-stringify the components
+Version._PACK_VERSION_REFERENCE_TUPLE = {
+    Version(key).data: value for key, value in Version._PACK_VERSION_REFERENCE.items()
+}
+
+_PARSE_CACHE: dict[str, Version] = {}
+
+# Shared bound instances so open-ended ranges never allocate
+_MIN_VERSION = Version("1.13")
+_MAX_VERSION = Version("1.21.1")
+
+
+class VersionRange(object):
+    """An inclusive range of game versions"""
+
+    __slots__ = ("_range", "_bounds")
+
+    _range: tuple[Version, Version]
+    _bounds: tuple[tuple[int, int, int], tuple[int, int, int]]
+
+    def __init__(self, lower: Version | str | None = None, upper: Version | str | None = None) -> None:
+        """An inclusive range of game versions
+
+        Args:
+            lower (Version | str | None, optional): The lowest version in the range. Defaults to Version.minimum().
+            upper (Version | str | None, optional): The highest version in the range. Defaults to Version.maximum().
+        """
+        if lower is None:
+            lower = _MIN_VERSION
+        elif type(lower) is str:
+            lower = Version.parse(lower)
+        if upper is None:
+            upper = _MAX_VERSION
+        elif type(upper) is str:
+            upper = Version.parse(upper)
+        self._range = (lower, upper)
+        # Raw tuples so containment checks skip the Version dunder dispatch
+        self._bounds = (lower.data, upper.data)
+
+    def contains(self, version: Version) -> bool:
+        """True when the given version falls inside this range
+
+        Args:
+            version (Version): The version to test
+        """
+        return self._bounds[0] <= version.data <= self._bounds[1]
+
+    @classmethod
+    def _raw(cls, lower: Version, upper: Version) -> 'VersionRange':
+        """Builds a range from two Version instances with no coercion,
+        for internal callers that never pass strings
+
+        Args:
+            lower (Version): The lowest version in the range
+            upper (Version): The highest version in the range
+        """
+        instance = object.__new__(cls)
+        instance._range = (lower, upper)
+        instance._bounds = (lower.data, upper.data)
+        return instance
+
+    @classmethod
+    def from_overlap(cls, first: 'VersionRange', second: 'VersionRange') -> 'VersionRange | None':
+        """Returns the overlap of two ranges, or None when they are disjoint
+
+        Args:
+            first (VersionRange): One range
+            second (VersionRange): The other range
+        """
+        lower = max(first.lower, second.lower)
+        upper = min(first.upper, second.upper)
+        if lower > upper:
+            return None
+        return cls._raw(lower, upper)
+
+    @classmethod
+    def largest(cls, first: 'VersionRange', second: 'VersionRange') -> 'VersionRange':
+        """Returns the smallest range covering both given ranges
+
+        Args:
+            first (VersionRange): One range
+            second (VersionRange): The other range
+        """
+        return cls._raw(min(first.lower, second.lower), max(first.upper, second.upper))
+
+    @property
+    def lower(self) -> Version:
+        """The lowest version in this range"""
+        return self._range[0]
+
+    @property
+    def upper(self) -> Version:
+        """The highest version in this range"""
+        return self._range[1]